@@ -35,6 +35,7 @@ from .emailer import render_email_html, send_daily_digest_async
 from .groq_client import AsyncGroqClient
 from .llm_client import LLMClient
 from .models import Summary
+from .rate_limiter import HostRateLimiter
 from .scraper import _build_client
 from .sources import NewsSource, default_registry
 from .summarizer import AsyncGeminiClient, classify_article, summarize_article
@@ -102,28 +103,48 @@ async def _process_one(
     date_str: str,
     url: str,
     breaker: CircuitBreaker,
+    limiter: HostRateLimiter,
+    scrape_semaphore: asyncio.Semaphore,
+    summarize_semaphore: asyncio.Semaphore,
+    saved_summaries: list[Summary],
+    save_lock: asyncio.Lock,
 ) -> Summary | None:
-    """Scrape + summarize one article, saving intermediate state on success."""
+    """Scrape + summarize one article, saving intermediate state on success.
+
+    The two stages hold separate semaphores so a slow LLM call doesn't
+    serialize scraping: all articles can fetch concurrently (bounded by
+    ``scrape_concurrency``) while summarization queues up behind the much
+    tighter ``summarize_concurrency`` limit.
+
+    ``saved_summaries`` is the run-wide accumulator of everything persisted
+    so far (seeded with today's pre-existing summaries). Appending to it
+    under ``save_lock`` and writing the whole list keeps the per-article
+    checkpoint behavior without a Firestore read + model re-parse per
+    article.
+    """
     if not breaker.allow():
         logger.warning("Circuit open; skipping: %s", url)
         return None
 
-    article = await source.scrape_article(http_client, url)
+    async with scrape_semaphore:
+        await limiter.wait(url)
+        article = await source.scrape_article(http_client, url)
     if not article:
         breaker.record_failure()
         return None
     breaker.record_success()
 
     try:
-        summary = await summarize_article(
-            client,
-            article.content,
-            article.title,
-            settings,
-            language=source.language,
-            url=url,
-            section=article.section,
-        )
+        async with summarize_semaphore:
+            summary = await summarize_article(
+                client,
+                article.content,
+                article.title,
+                settings,
+                language=source.language,
+                url=url,
+                section=article.section,
+            )
     except Exception:
         logger.exception("Summarization crashed for %s", url)
         return None
@@ -134,10 +155,9 @@ async def _process_one(
     summary.section = article.section or ""
 
     try:
-        existing = db.get_existing_summaries(date_str)
-        existing_objs: list[Summary] = [Summary(**a) for a in existing if a.get("title")]
-        all_summaries = [*existing_objs, summary]
-        db.save_summaries(date_str, [s.model_dump() for s in all_summaries])
+        async with save_lock:
+            saved_summaries.append(summary)
+            db.save_summaries(date_str, [s.model_dump() for s in saved_summaries])
         logger.info(
             "Summarized [%s]: %s [%s]",
             summary.source,
@@ -158,6 +178,9 @@ async def _process_source(
     date_str: str,
     existing_urls: set[str],
     breaker: CircuitBreaker,
+    limiter: HostRateLimiter,
+    saved_summaries: list[Summary],
+    save_lock: asyncio.Lock,
 ) -> list[Summary]:
     """Fetch, dedup, and process all new articles for a single source."""
     logger.info(
@@ -175,28 +198,34 @@ async def _process_source(
         logger.warning("[%s] No URLs found; skipping", source.name)
         return []
 
-    new_urls = [u for u in urls if u not in existing_urls]
+    # Sources dedupe during discovery, but don't rely on it: a duplicate
+    # slipping through here costs a scrape plus LLM calls.
+    new_urls = list(dict.fromkeys(u for u in urls if u not in existing_urls))
     if not new_urls:
         logger.info("[%s] All URLs already processed today", source.name)
         return []
 
     scrape_semaphore = asyncio.Semaphore(settings.scrape_concurrency)
-    process_semaphore = asyncio.Semaphore(settings.summarize_concurrency)
+    summarize_semaphore = asyncio.Semaphore(settings.summarize_concurrency)
 
     async def _guarded(url: str) -> Summary | None:
         if not breaker.allow():
             logger.warning("Circuit open; skipping: %s", url)
             return None
-        async with process_semaphore, scrape_semaphore:
-            return await _process_one(
-                settings,
-                http_client,
-                source,
-                client,
-                date_str,
-                url,
-                breaker,
-            )
+        return await _process_one(
+            settings,
+            http_client,
+            source,
+            client,
+            date_str,
+            url,
+            breaker,
+            limiter,
+            scrape_semaphore,
+            summarize_semaphore,
+            saved_summaries,
+            save_lock,
+        )
 
     results = await asyncio.gather(*(_guarded(u) for u in new_urls))
     return [r for r in results if r is not None]
@@ -360,7 +389,11 @@ async def run_async(
             are skipped. Use for verifying updated template content without
             spamming the full list.
     """
-    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    now = datetime.now(UTC)
+    today_str = now.strftime("%Y-%m-%d")
+    # Display date, computed once so a run crossing midnight stamps every
+    # render and digest with the same day.
+    today_display = now.strftime("%A, %B %d")
     logger.info("=== The Daily Bot starting (date=%s) ===", today_str)
 
     health.record_run_start(today_str)
@@ -378,6 +411,7 @@ async def run_async(
         threshold=settings.circuit_breaker_threshold,
         cooldown_seconds=settings.circuit_breaker_cooldown_seconds,
     )
+    limiter = HostRateLimiter(settings.scrape_min_interval_seconds)
 
     try:
         source_names = _parse_sources(settings)
@@ -429,6 +463,12 @@ async def run_async(
 
         new_summaries: list[Summary] = []
 
+        # Run-wide accumulator for per-article checkpoint saves: everything
+        # in Firestore so far, kept in memory so _process_one never has to
+        # re-read the document before each write.
+        saved_summaries: list[Summary] = list(existing_summaries)
+        save_lock = asyncio.Lock()
+
         if retry_failed_only:
             await _retry_failed_articles(
                 settings, gemini, groq_client, breaker, today_str, existing_summaries
@@ -457,6 +497,9 @@ async def run_async(
                         today_str,
                         existing_urls,
                         breaker,
+                        limiter,
+                        saved_summaries,
+                        save_lock,
                     )
                 except Exception:
                     logger.exception(
@@ -478,7 +521,7 @@ async def run_async(
             return
 
         try:
-            template_html = render_email_html(summaries)
+            template_html = render_email_html(summaries, today_display)
             db.save_latest_template(template_html)
             logger.info("Rendered template saved to Firestore")
         except Exception:
@@ -559,6 +602,7 @@ async def run_async(
                 relevant_summaries,
                 emails,
                 on_result=lambda email, status, error: _safe_log(today_str, email, status, error),
+                today_date=today_display,
             )
             sent += group_sent
             failed += group_failed
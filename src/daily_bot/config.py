@@ -48,6 +48,13 @@ class Settings(BaseSettings):
 
     smtp_host: str = Field(default="smtp.gmail.com", description="SMTP server host")
     smtp_port: int = Field(default=465, description="SMTP server port")
+    smtp_timeout_seconds: int = Field(
+        default=30,
+        description=(
+            "Socket timeout for SMTP connections. Without one a stalled "
+            "server hangs the whole send batch indefinitely."
+        ),
+    )
 
     bbc_news_url: str = Field(
         default="https://www.bbc.com/news",
@@ -77,13 +84,57 @@ class Settings(BaseSettings):
         ),
     )
 
+    summary_cache_dir: str = Field(
+        default="",
+        description=(
+            "Directory for the on-disk summary cache keyed by article content "
+            "hash. Re-runs and --retry-failed passes reuse cached summaries "
+            "instead of repeating LLM calls. Empty = caching disabled."
+        ),
+    )
+    summary_cache_ttl_days: int = Field(
+        default=7,
+        description=(
+            "Days a summary cache entry stays valid before it is treated as "
+            "a miss and deleted. Articles get edited after publication, so "
+            "week-old cached summaries can go stale. 0 = never expire."
+        ),
+    )
+
     chunk_max_words: int = Field(default=600, description="Max words per chunk")
+    summary_single_call_max_words: int = Field(
+        default=1200,
+        description=(
+            "Articles up to this many cleaned words are summarized in one "
+            "LLM call even if they span multiple chunks, skipping the "
+            "chunk+merge round-trips. Gemini 2.5 Flash has ample context "
+            "for these sizes. 0 = always chunk+merge past one chunk."
+        ),
+    )
     summary_min_words: int = Field(default=40, description="Min words to attempt summary")
+    summary_max_input_words: int = Field(
+        default=3000,
+        description=(
+            "Max words of cleaned article text sent to the LLM. Input tokens "
+            "dominate per-article cost and latency, and a digest summary only "
+            "needs the lead and body — not comment-thread-length tails. "
+            "Typical BBC/G1 articles are 300-1500 words, so the default only "
+            "trims pathological pages. 0 = no cap."
+        ),
+    )
 
     email_batch_size: int = Field(default=50, description="Subscribers per SMTP batch")
     email_batch_delay_seconds: int = Field(default=2, description="Delay between batches")
 
     scrape_concurrency: int = Field(default=5, description="Max concurrent article scrapes")
+    scrape_min_interval_seconds: float = Field(
+        default=0.0,
+        description=(
+            "Minimum seconds between requests to the same host during the "
+            "scrape stage. Politeness spacing that avoids 429s and "
+            "connection resets when concurrency bursts one host. 0 = off."
+        ),
+    )
     summarize_concurrency: int = Field(
         default=1,
         description="Max concurrent Gemini calls. Keep low (1-2) to stay under the free-tier 5 req/min limit.",
@@ -7,11 +7,12 @@ tests and tooling without real credentials.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from typing import TYPE_CHECKING
 
+import orjson
+
 from .models import Subscriber
 
 if TYPE_CHECKING:
@@ -68,7 +69,7 @@ def get_db() -> Client:
             "or in the project root .env file as a JSON string."
         )
 
-    creds_dict = json.loads(creds_json)
+    creds_dict = orjson.loads(creds_json)
     cred = credentials.Certificate(creds_dict)
     firebase_admin.initialize_app(cred)
     _db = _firestore.client()
@@ -93,14 +94,22 @@ def get_existing_summaries(date_str: str) -> list[dict]:
 
 
 def save_summaries(date_str: str, summaries: list[dict]) -> None:
-    """Persist the day's summaries to Firestore."""
+    """Persist the day's summaries to Firestore.
+
+    Goes through a WriteBatch so the write stays a single round-trip if
+    per-article documents (e.g. for search/filter UIs) are ever added
+    alongside the day document.
+    """
     db = get_db()
-    db.collection("dailySummaries").document(date_str).set(
+    batch = db.batch()
+    batch.set(
+        db.collection("dailySummaries").document(date_str),
         {
             "date": date_str,
             "articles": summaries,
-        }
+        },
     )
+    batch.commit()
     logger.info("Saved %d summaries to Firestore for %s", len(summaries), date_str)
 
 
@@ -5,6 +5,7 @@ Refactored from email_sender.py with:
 - html.escape() on all dynamic content (XSS fix)
 - Settings injection (no more positional arg sprawl)
 - Per-subscriber sending (BCC-free, individual delivery)
+- One SMTP connection + login per batch (not per recipient)
 - Batch + delay logic to respect SMTP rate limits
 - Per-subscriber result callback for audit logging
 - Async dispatch via asyncio.to_thread for non-blocking sends
@@ -47,6 +48,14 @@ _jinja_env = jinja2.Environment(
     autoescape=True,
     loader=jinja2.FileSystemLoader(str(TEMPLATE_DIR)),
 )
+# Compiled once at import. get_template() on every render would re-stat the
+# template file (auto_reload) and hit the cache lookup each call; the
+# template ships inside the package and never changes mid-run.
+_EMAIL_TEMPLATE = _jinja_env.get_template("email.html.j2")
+
+# Built once; ssl.create_default_context() re-reads the system CA bundle
+# from disk on every call, which is pure waste per connection.
+_SSL_CONTEXT = ssl.create_default_context()
 
 
 def _branded_placeholder(text: str) -> str:
@@ -54,11 +63,14 @@ def _branded_placeholder(text: str) -> str:
     return f"https://placehold.co/600x300/F0F4F1/709775?text={safe_text}"
 
 
+# Every image-less article uses the same placeholder; build it once instead
+# of re-quoting the literal per article.
+_DEFAULT_PLACEHOLDER = _branded_placeholder("News Update")
+
+
 def _prepare_article(article: Summary) -> dict[str, str]:
     raw_img = article.image_url
-    image_src = (
-        raw_img if raw_img and raw_img.startswith("http") else _branded_placeholder("News Update")
-    )
+    image_src = raw_img if raw_img and raw_img.startswith("http") else _DEFAULT_PLACEHOLDER
     return {
         "title": article.title,
         "summary": article.summary,
@@ -69,11 +81,16 @@ def _prepare_article(article: Summary) -> dict[str, str]:
     }
 
 
-def render_email_html(summaries: list[Summary]) -> str:
-    """Render the daily digest as branded, escaped HTML."""
-    template = _jinja_env.get_template("email.html.j2")
-    today_date = datetime.now(UTC).strftime("%A, %B %d")
-    return template.render(
+def render_email_html(summaries: list[Summary], today_date: str | None = None) -> str:
+    """Render the daily digest as branded, escaped HTML.
+
+    ``today_date`` lets the pipeline compute the display date once per run
+    and reuse it across every render, so a run that crosses midnight can't
+    stamp two different dates on the same day's digests.
+    """
+    if today_date is None:
+        today_date = datetime.now(UTC).strftime("%A, %B %d")
+    return _EMAIL_TEMPLATE.render(
         theme=THEME,
         today_date=today_date,
         articles=[_prepare_article(a) for a in summaries],
@@ -81,25 +98,46 @@ def render_email_html(summaries: list[Summary]) -> str:
     )
 
 
-def _build_message(settings: Settings, recipient: str, html_body: str) -> MIMEMultipart:
-    message = MIMEMultipart("alternative")
+def _build_subject() -> str:
     today_str = datetime.now(UTC).strftime("%B %d")
-    message["Subject"] = f"\u2728 Your Daily Briefing - {today_str}"
+    return f"\u2728 Your Daily Briefing - {today_str}"
+
+
+def _build_message(
+    settings: Settings,
+    recipient: str,
+    html_body: str,
+    *,
+    subject: str | None = None,
+    body_part: MIMEText | None = None,
+) -> MIMEMultipart:
+    """Build the per-recipient MIME message.
+
+    Only the To header varies across a dispatch, so batch senders pass a
+    precomputed ``subject`` and ``body_part`` (encoding the HTML body into
+    a MIMEText is the expensive step) and this just wraps them.
+    """
+    message = MIMEMultipart("alternative")
+    message["Subject"] = subject if subject is not None else _build_subject()
     message["From"] = f"The Daily Bot <{settings.sender_email}>"
     message["To"] = recipient
-    message.attach(MIMEText(html_body, "html"))
+    message.attach(body_part if body_part is not None else MIMEText(html_body, "html"))
     return message
 
 
 def send_to_subscriber(settings: Settings, recipient: str, html_body: str) -> None:
     """Send the rendered HTML email to a single subscriber."""
     message = _build_message(settings, recipient, html_body)
-    context = ssl.create_default_context()
 
     try:
-        with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, context=context) as server:
+        with smtplib.SMTP_SSL(
+            settings.smtp_host,
+            settings.smtp_port,
+            timeout=settings.smtp_timeout_seconds,
+            context=_SSL_CONTEXT,
+        ) as server:
             server.login(settings.sender_email, settings.sender_password)
-            server.sendmail(settings.sender_email, recipient, message.as_string())
+            server.sendmail(settings.sender_email, recipient, message.as_bytes())
         logger.info("Email sent to %s", recipient)
     except smtplib.SMTPAuthenticationError:
         logger.error("SMTP auth failed; check SENDER_PASSWORD")
@@ -109,11 +147,63 @@ def send_to_subscriber(settings: Settings, recipient: str, html_body: str) -> No
         raise
 
 
+def _send_batch(
+    settings: Settings,
+    recipients: list[str],
+    html_body: str,
+) -> list[tuple[str, bool, str | None]]:
+    """Send to a batch of recipients over a single SMTP connection.
+
+    One TLS handshake + one LOGIN round-trip per batch instead of per
+    recipient. A failed send is recorded and the rest of the batch
+    continues; a connection or login failure marks every remaining
+    recipient as failed without raising into the dispatcher.
+
+    Returns (email, ok, error) per recipient, in batch order.
+    """
+    results: list[tuple[str, bool, str | None]] = []
+    # Everything but the To header is identical across the batch; encode
+    # the (potentially large) HTML body into a MIMEText once, not per
+    # recipient.
+    subject = _build_subject()
+    body_part = MIMEText(html_body, "html")
+    try:
+        with smtplib.SMTP_SSL(
+            settings.smtp_host,
+            settings.smtp_port,
+            timeout=settings.smtp_timeout_seconds,
+            context=_SSL_CONTEXT,
+        ) as server:
+            server.login(settings.sender_email, settings.sender_password)
+            for recipient in recipients:
+                message = _build_message(
+                    settings, recipient, html_body, subject=subject, body_part=body_part
+                )
+                try:
+                    # as_bytes() goes straight to the wire; as_string() would
+                    # build the full str only for smtplib to re-encode it.
+                    server.sendmail(settings.sender_email, recipient, message.as_bytes())
+                except Exception as exc:
+                    logger.error("Failed to send to %s: %s", recipient, exc)
+                    results.append((recipient, False, str(exc)))
+                    continue
+                logger.info("Email sent to %s", recipient)
+                results.append((recipient, True, None))
+    except smtplib.SMTPAuthenticationError as exc:
+        logger.error("SMTP auth failed; check SENDER_PASSWORD")
+        results.extend((r, False, str(exc)) for r in recipients[len(results) :])
+    except Exception as exc:
+        logger.error("SMTP connection failed: %s", exc)
+        results.extend((r, False, str(exc)) for r in recipients[len(results) :])
+    return results
+
+
 def send_daily_digest(
     settings: Settings,
     summaries: list[Summary],
     subscribers: list[str],
     on_result: Callable[[str, str, str | None], None] | None = None,
+    today_date: str | None = None,
 ) -> tuple[int, int]:
     """Render once, then send to all subscribers in batches with delay.
 
@@ -126,7 +216,7 @@ def send_daily_digest(
         logger.warning("No subscribers to send to; skipping dispatch")
         return 0, 0
 
-    html_body = render_email_html(summaries)
+    html_body = render_email_html(summaries, today_date)
     logger.info(
         "Dispatching digest to %d subscribers in batches of %d",
         len(subscribers),
@@ -140,17 +230,15 @@ def send_daily_digest(
 
     for start in range(0, len(subscribers), batch_size):
         batch = subscribers[start : start + batch_size]
-        for email in batch:
-            try:
-                send_to_subscriber(settings, email, html_body)
-            except Exception as exc:
+        for email, ok, err in _send_batch(settings, batch, html_body):
+            if ok:
+                sent += 1
+                if on_result:
+                    on_result(email, "sent", None)
+            else:
                 failed += 1
                 if on_result:
-                    on_result(email, "failed", str(exc))
-                continue
-            sent += 1
-            if on_result:
-                on_result(email, "sent", None)
+                    on_result(email, "failed", err)
         if start + batch_size < len(subscribers):
             time.sleep(delay)
 
@@ -163,18 +251,19 @@ async def send_daily_digest_async(
     summaries: list[Summary],
     subscribers: list[str],
     on_result: Callable[[str, str, str | None], None] | None = None,
+    today_date: str | None = None,
 ) -> tuple[int, int]:
     """Async version of send_daily_digest.
 
-    Uses asyncio.to_thread to run blocking SMTP calls without blocking the
-    event loop, while still respecting batch boundaries and inter-batch
-    delay for rate limiting.
+    Each batch's blocking SMTP work runs in a worker thread via
+    asyncio.to_thread so the event loop stays free, while batch boundaries
+    and inter-batch delay are still respected for rate limiting.
     """
     if not subscribers:
         logger.warning("No subscribers to send to; skipping dispatch")
         return 0, 0
 
-    html_body = render_email_html(summaries)
+    html_body = render_email_html(summaries, today_date)
     logger.info(
         "Dispatching digest to %d subscribers in batches of %d (async)",
         len(subscribers),
@@ -189,14 +278,7 @@ async def send_daily_digest_async(
     for start in range(0, len(subscribers), batch_size):
         batch = subscribers[start : start + batch_size]
 
-        async def _send_one(email: str) -> tuple[str, bool, str | None]:
-            try:
-                await asyncio.to_thread(send_to_subscriber, settings, email, html_body)
-            except Exception as exc:
-                return email, False, str(exc)
-            return email, True, None
-
-        results = await asyncio.gather(*(_send_one(e) for e in batch))
+        results = await asyncio.to_thread(_send_batch, settings, batch, html_body)
         for email, ok, err in results:
             if ok:
                 sent += 1
@@ -52,6 +52,11 @@ class AsyncGroqClient:
         self._model = settings.groq_model
         self._retries = settings.groq_retries
 
+    @property
+    def model_name(self) -> str:
+        """Model identifier, exposed so cache keys can include it."""
+        return self._model
+
     async def generate(self, prompt: str) -> str | None:
         """Generate text from a prompt with retries. Returns None on failure.
 
@@ -11,18 +11,46 @@ Refactored from the original MyNews.py with:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from collections.abc import Iterator
 from urllib.parse import urljoin
 
 import httpx
+import orjson
+import soupsieve
 from bs4 import BeautifulSoup
 
+# bs4's top-level namespace re-exports SoupStrainer without listing it in
+# __all__, which strict mypy rejects; import from the defining module.
+from bs4._typing import _StrainableAttributes
+from bs4.filter import SoupStrainer
+
+try:
+    # selectolax's Lexbor engine walks anchors in C; an order of magnitude
+    # faster than even lxml-backed bs4 for flat "select + read attribute"
+    # scans like URL discovery. Optional: binary wheels cover the platforms
+    # we run on, but the strained-bs4 path below works without it.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - exercised via monkeypatch in tests
+    LexborHTMLParser = None  # type: ignore[assignment, misc]
+
 from .config import Settings
 from .models import ScrapedArticle
 
 logger = logging.getLogger(__name__)
 
+# lxml's C parser tokenizes the ~500 KB BBC homepage and article pages an
+# order of magnitude faster than the pure-Python "html.parser" backend, and
+# handles encoding detection on raw bytes itself.
+BS4_PARSER = "lxml"
+
+# Restrict homepage parsing to article anchors. The BBC homepage is a large
+# document and URL discovery only needs <a href="..."/news/articles/..."> tags;
+# a SoupStrainer stops bs4 from materializing the rest of the DOM at all.
+_ARTICLE_ANCHOR_STRAINER = SoupStrainer(
+    "a", href=lambda href: bool(href) and "/news/articles/" in href
+)
+
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -47,6 +75,20 @@ def _normalize_url(url: str | list | None) -> str | None:
     return None
 
 
+# Fallback image selectors, compiled once at import. soupsieve re-parses a
+# selector string on every .select_one() call; precompiling amortizes that
+# across all scraped articles in a run.
+_IMAGE_SELECTORS: tuple[soupsieve.SoupSieve, ...] = tuple(
+    soupsieve.compile(sel)
+    for sel in (
+        "img[data-testid='hero-image']",
+        "div[data-component='image-block'] img",
+        "figure img",
+        "main img",
+    )
+)
+
+
 def _extract_article_image(soup: BeautifulSoup) -> str | None:
     """Extract the main article image using prioritized strategies."""
     og_image = soup.find("meta", attrs={"property": "og:image"})
@@ -61,14 +103,8 @@ def _extract_article_image(soup: BeautifulSoup) -> str | None:
         if url:
             return url
 
-    selectors = [
-        "img[data-testid='hero-image']",
-        "div[data-component='image-block'] img",
-        "figure img",
-        "main img",
-    ]
-    for sel in selectors:
-        img = soup.select_one(sel)
+    for sel in _IMAGE_SELECTORS:
+        img = sel.select_one(soup)
         if not img:
             continue
 
@@ -88,44 +124,50 @@ def _extract_article_image(soup: BeautifulSoup) -> str | None:
     return None
 
 
+# Body paragraph scopes, in priority order. Descendant selectors so each
+# scope is a single tree traversal (the old code selected the text-block
+# containers and then re-recursed into each one with find_all).
+_BODY_SELECTORS: tuple[soupsieve.SoupSieve, ...] = tuple(
+    soupsieve.compile(sel)
+    for sel in (
+        "div[data-component='text-block'] p",
+        "article p",
+    )
+)
+_MAIN_PARAGRAPHS = soupsieve.compile("main p")
+
+
 def _extract_article_text(soup: BeautifulSoup) -> str:
-    """Extract the article body text using prioritized strategies."""
-    blocks = soup.select("div[data-component='text-block']")
-    if not blocks:
-        blocks = soup.select("article p")
-
-    paragraphs: list[str] = []
-    if blocks:
-        for block in blocks:
-            if block.name == "p":
-                text = block.get_text(strip=True)
-                if text:
-                    paragraphs.append(text)
-            else:
-                for p in block.find_all("p"):
-                    text = p.get_text(strip=True)
-                    if text:
-                        paragraphs.append(text)
-
-    if not paragraphs:
-        main_content = soup.find("main")
-        if main_content:
-            for p in main_content.find_all("p"):
-                text = p.get_text(strip=True)
-                if text and len(text) > 20:
-                    paragraphs.append(text)
-
-    if paragraphs:
-        return "\n".join(paragraphs)
+    """Extract the article body text using prioritized strategies.
+
+    The first scope that yields at least one non-empty paragraph wins, so
+    a typical BBC article costs one selector pass instead of three.
+    """
+    for sel in _BODY_SELECTORS:
+        texts = [t for p in sel.select(soup) if (t := p.get_text(strip=True))]
+        if texts:
+            return "\n".join(texts)
+
+    # Last resort: any <main> paragraphs, filtering out short boilerplate.
+    texts = [
+        t for p in _MAIN_PARAGRAPHS.select(soup) if (t := p.get_text(strip=True)) and len(t) > 20
+    ]
+    if texts:
+        return "\n".join(texts)
     return "Could not find article content."
 
 
 # Metadata sources for the article section, in priority order. The first
 # non-empty match wins. BBC uses <meta property="article:section"> on most
 # pages; some pages use the older <meta name="article:section"> form.
-_SECTION_META_SELECTORS: tuple[tuple[str, str], ...] = (
-    ('meta[property="article:section"]', "content"),
-    ('meta[name="article:section"]', "content"),
+# Plain attribute dicts so lookup goes through soup.find, skipping the
+# soupsieve CSS machinery entirely for these simple matches. Annotated
+# with bs4's own attrs alias: dict is invariant in its value type, so a
+# dict[str, str] wouldn't be accepted where find() takes the full
+# strainable-value union.
+_SECTION_META_ATTRS: tuple[_StrainableAttributes, ...] = (
+    {"property": "article:section"},
+    {"name": "article:section"},
 )
 
 
@@ -140,17 +182,20 @@ def _extract_section(soup: BeautifulSoup) -> str:
     ``"World"``, ``"UK Politics"``). The summarizer normalizes it to a
     ``VALID_CATEGORIES`` value via :func:`_normalize_section`.
     """
-    for selector, attr in _SECTION_META_SELECTORS:
-        tag = soup.select_one(selector)
+    for attrs in _SECTION_META_ATTRS:
+        tag = soup.find("meta", attrs=attrs)
         if not tag:
             continue
-        value = (tag.get(attr) or "").strip()
+        value = (tag.get("content") or "").strip()
         if value:
             return value
 
     for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
         try:
-            data = json.loads(script.string or "")
+            # orjson (Rust) parses the often multi-KB JSON-LD blobs several
+            # times faster than stdlib json. It rejects str subclasses, so
+            # coerce bs4's NavigableString to a plain str first.
+            data = orjson.loads(str(script.string or ""))
         except (ValueError, TypeError):
             continue
         section = _section_from_jsonld(data)
@@ -189,9 +234,25 @@ def _section_from_jsonld(data: object) -> str:
 
 
 def _build_client(settings: Settings) -> httpx.AsyncClient:
-    """Build a configured httpx AsyncClient with sensible defaults."""
+    """Build a configured httpx AsyncClient with sensible defaults.
+
+    HTTP/2 lets the concurrent article fetches against the same host
+    multiplex over one TLS connection instead of opening one per request
+    (BBC and G1 both serve h2); httpx falls back to HTTP/1.1 transparently
+    where the server doesn't.
+
+    Accept-Encoding is pinned explicitly rather than left to httpx's
+    decoder detection: article pages are 150-300 KB of HTML, and a
+    missing brotli wheel silently downgrading to gzip (or a future
+    header refactor dropping compression entirely) should be visible
+    here, not discovered in fetch latency.
+    """
     return httpx.AsyncClient(
-        headers={"User-Agent": DEFAULT_USER_AGENT},
+        http2=True,
+        headers={
+            "User-Agent": DEFAULT_USER_AGENT,
+            "Accept-Encoding": "gzip, deflate, br",
+        },
         timeout=httpx.Timeout(settings.http_timeout_seconds),
         limits=httpx.Limits(
             max_connections=settings.http_max_connections,
@@ -201,33 +262,92 @@ def _build_client(settings: Settings) -> httpx.AsyncClient:
     )
 
 
+# Transient-failure retry policy for page fetches. Connection resets and
+# 5xx blips are the dominant scrape error class and usually clear within
+# a second or two; 4xx responses are never retried because re-requesting
+# a 404 can't help. Aborting on a sustained outage stays the circuit
+# breaker's job.
+_FETCH_ATTEMPTS = 3
+_FETCH_BACKOFF_SECONDS = 0.5  # doubles per attempt: 0.5s, 1s
+
+
+async def _get_with_retries(client: httpx.AsyncClient, url: str) -> httpx.Response | None:
+    """GET ``url`` with short exponential backoff on transient failures.
+
+    Returns ``None`` once attempts are exhausted (or immediately on a
+    non-retryable response) so callers keep their None-on-failure
+    contract.
+    """
+    for attempt in range(1, _FETCH_ATTEMPTS + 1):
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as exc:
+            status = exc.response.status_code
+            if status < 500:
+                logger.error("HTTP %d for %s; not retrying", status, url)
+                return None
+            logger.warning("HTTP %d for %s (attempt %d/%d)", status, url, attempt, _FETCH_ATTEMPTS)
+        except httpx.HTTPError as exc:
+            logger.warning(
+                "Network error for %s (attempt %d/%d): %s", url, attempt, _FETCH_ATTEMPTS, exc
+            )
+        except Exception:
+            logger.exception("Unexpected error fetching %s", url)
+            return None
+        if attempt < _FETCH_ATTEMPTS:
+            await asyncio.sleep(_FETCH_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    logger.error("Giving up on %s after %d attempts", url, _FETCH_ATTEMPTS)
+    return None
+
+
+def _iter_article_hrefs(content: bytes) -> Iterator[str]:
+    """Yield the href of every article anchor on a homepage document.
+
+    Uses selectolax (Lexbor, C traversal) when installed; otherwise falls
+    back to strainer-limited BeautifulSoup. Both paths yield hrefs in
+    document order, so downstream dedup/limit behavior is identical.
+
+    Lazy on purpose: the caller breaks once it has ``limit`` unique URLs,
+    so anchors past that point are never even attribute-read.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        for node in tree.css('a[href*="/news/articles/"]'):
+            href = node.attributes.get("href")
+            if href:
+                yield href
+        return
+
+    soup = BeautifulSoup(content, BS4_PARSER, parse_only=_ARTICLE_ANCHOR_STRAINER)
+    for tag in soup.find_all("a", href=True):
+        yield str(tag.get("href"))
+
+
 async def get_top_story_urls_async(
     client: httpx.AsyncClient, homepage_url: str, limit: int
 ) -> list[str]:
     """Fetch the BBC News homepage and return top story article URLs."""
     logger.info("Fetching top stories from %s", homepage_url)
-    try:
-        response = await client.get(homepage_url)
-        response.raise_for_status()
-    except httpx.HTTPError as exc:
-        logger.error("Could not retrieve %s: %s", homepage_url, exc)
+    response = await _get_with_retries(client, homepage_url)
+    if response is None:
         return []
 
-    soup = BeautifulSoup(response.content, "html.parser")
-    headlines = soup.find_all("a", href=True)
-
     unique_urls: list[str] = []
     seen: set[str] = set()
 
-    for tag in headlines:
-        raw_href = tag.get("href")
-        if not raw_href:
-            continue
-        href = str(raw_href).strip()
+    for raw_href in _iter_article_hrefs(response.content):
+        href = raw_href.strip()
         if "/news/articles/" not in href:
             continue
 
-        absolute_url = urljoin(homepage_url, href)
+        # urljoin parses both URLs every call; skip it for the hrefs that
+        # are already absolute (common on BBC promo modules).
+        if href.startswith(("http://", "https://")):
+            absolute_url = href
+        else:
+            absolute_url = urljoin(homepage_url, href)
         if absolute_url in seen:
             continue
         seen.add(absolute_url)
@@ -244,17 +364,11 @@ async def scrape_article_content_async(
     client: httpx.AsyncClient, url: str
 ) -> ScrapedArticle | None:
     """Scrape a single article and return a ScrapedArticle, or None on failure."""
-    try:
-        response = await client.get(url)
-        response.raise_for_status()
-    except httpx.HTTPError as exc:
-        logger.error("Network error scraping %s: %s", url, exc)
-        return None
-    except Exception:
-        logger.exception("Unexpected error scraping %s", url)
+    response = await _get_with_retries(client, url)
+    if response is None:
         return None
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    soup = BeautifulSoup(response.content, BS4_PARSER)
 
     title_tag = soup.find("h1")
     title = title_tag.get_text(strip=True) if title_tag else "No title found"
@@ -276,17 +390,28 @@ async def scrape_many(
     settings: Settings,
     urls: list[str],
     semaphore: asyncio.Semaphore,
+    client: httpx.AsyncClient | None = None,
 ) -> list[ScrapedArticle]:
     """Scrape many URLs concurrently, bounded by the semaphore.
 
     Returns a list of successfully scraped articles (failures are logged and skipped).
     Order is not preserved — call sites that care should re-sort by url if needed.
+
+    Pass ``client`` to reuse an existing pooled connection (keep-alive saves a
+    TCP+TLS handshake per article against the same host); when omitted, a
+    client is built from ``settings`` and closed on exit.
     """
-    async with _build_client(settings) as client:
 
+    async def _scrape_all(http_client: httpx.AsyncClient) -> list[ScrapedArticle | None]:
         async def _one(url: str) -> ScrapedArticle | None:
             async with semaphore:
-                return await scrape_article_content_async(client, url)
+                return await scrape_article_content_async(http_client, url)
+
+        return await asyncio.gather(*(_one(url) for url in urls), return_exceptions=False)
 
-        results = await asyncio.gather(*(_one(url) for url in urls), return_exceptions=False)
+    if client is not None:
+        results = await _scrape_all(client)
+    else:
+        async with _build_client(settings) as owned_client:
+            results = await _scrape_all(owned_client)
     return [r for r in results if r is not None]
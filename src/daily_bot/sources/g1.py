@@ -11,17 +11,28 @@ import logging
 from urllib.parse import urljoin
 
 import httpx
+import soupsieve
 from bs4 import BeautifulSoup
 
+try:
+    # Same optional fast path as scraper.py; imported here directly rather
+    # than re-exported through it, so each module owns its own fallback.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - exercised via monkeypatch in tests
+    LexborHTMLParser = None  # type: ignore[assignment, misc]
+
 from ..models import ScrapedArticle
+from ..scraper import BS4_PARSER, _get_with_retries
 from .base import NewsSource
 
 logger = logging.getLogger(__name__)
 
 _URL_SUFFIX = ".ghtml"
-_TITLE_SELECTORS = ("h1", ".content-head__title")
-_BODY_SELECTORS = ("article p", "main p", ".mc-article-body p")
-_IMAGE_SELECTORS = ("article img", "main img")
+# Compiled once at import; soupsieve otherwise re-parses the selector string
+# on every select/select_one call (see scraper._IMAGE_SELECTORS).
+_TITLE_SELECTORS = tuple(soupsieve.compile(s) for s in ("h1", ".content-head__title"))
+_BODY_SELECTORS = tuple(soupsieve.compile(s) for s in ("article p", "main p", ".mc-article-body p"))
+_IMAGE_SELECTORS = tuple(soupsieve.compile(s) for s in ("article img", "main img"))
 
 
 def _normalize_url(url: str | list | None) -> str | None:
@@ -44,7 +55,7 @@ def _normalize_url(url: str | list | None) -> str | None:
 def _extract_article_text(soup: BeautifulSoup) -> str:
     """Extract the article body text using prioritized strategies."""
     for selector in _BODY_SELECTORS:
-        paragraphs = soup.select(selector)
+        paragraphs = selector.select(soup)
         texts = [p.get_text(strip=True) for p in paragraphs]
         texts = [t for t in texts if t]
         if texts:
@@ -61,7 +72,7 @@ def _extract_article_image(soup: BeautifulSoup) -> str | None:
             return url
 
     for selector in _IMAGE_SELECTORS:
-        img = soup.select_one(selector)
+        img = selector.select_one(soup)
         if not img:
             continue
         url = _normalize_url(img.get("src"))
@@ -93,27 +104,36 @@ class G1Source(NewsSource):
     async def fetch_urls(self, client: httpx.AsyncClient, limit: int) -> list[str]:
         """Return up to ``limit`` unique G1 article URLs from the homepage."""
         logger.info("Fetching G1 top stories from %s", self._homepage_url)
-        try:
-            response = await client.get(self._homepage_url)
-            response.raise_for_status()
-        except httpx.HTTPError as exc:
-            logger.error("Could not retrieve %s: %s", self._homepage_url, exc)
+        response = await _get_with_retries(client, self._homepage_url)
+        if response is None:
             return []
 
-        soup = BeautifulSoup(response.content, "html.parser")
-        anchors = soup.select("a.feed-post-link[href]")
+        # Homepage URL discovery is a flat anchor scan; use the C-level
+        # selectolax traversal when available (see scraper._iter_article_hrefs).
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(response.content)
+            hrefs = (node.attributes.get("href") for node in tree.css("a.feed-post-link[href]"))
+        else:
+            soup = BeautifulSoup(response.content, BS4_PARSER)
+            # str() up front: bs4 can hand back attribute lists, and the
+            # lexbor branch above already yields plain strings.
+            hrefs = (str(tag.get("href") or "") for tag in soup.select("a.feed-post-link[href]"))
 
         unique_urls: list[str] = []
         seen: set[str] = set()
-        for tag in anchors:
-            href = tag.get("href")
+        for href in hrefs:
             if not href:
                 continue
-            href_str = str(href).strip()
+            href_str = href.strip()
             if _URL_SUFFIX not in href_str:
                 continue
 
-            absolute_url = urljoin(self._homepage_url, href_str)
+            # G1 homepage hrefs are absolute; urljoin only for the odd
+            # relative one.
+            if href_str.startswith(("http://", "https://")):
+                absolute_url = href_str
+            else:
+                absolute_url = urljoin(self._homepage_url, href_str)
             if "g1.globo.com" not in absolute_url:
                 continue
             if absolute_url in seen:
@@ -129,21 +149,15 @@ class G1Source(NewsSource):
 
     async def scrape_article(self, client: httpx.AsyncClient, url: str) -> ScrapedArticle | None:
         """Scrape a single G1 article and return a ``ScrapedArticle`` or ``None``."""
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-        except httpx.HTTPError as exc:
-            logger.error("Network error scraping %s: %s", url, exc)
-            return None
-        except Exception:
-            logger.exception("Unexpected error scraping %s", url)
+        response = await _get_with_retries(client, url)
+        if response is None:
             return None
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, BS4_PARSER)
 
-        title_tag: BeautifulSoup | None = None
+        title_tag = None
         for selector in _TITLE_SELECTORS:
-            title_tag = soup.select_one(selector)
+            title_tag = selector.select_one(soup)
             if title_tag:
                 break
         title = title_tag.get_text(strip=True) if title_tag else "No title found"
@@ -13,15 +13,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import re
 import time
+from typing import TYPE_CHECKING
 
-from google import genai as _genai
-from google.genai import errors as _genai_errors
+if TYPE_CHECKING:
+    from google.genai import errors as _genai_errors
 
 from .config import Settings
 from .llm_client import LLMClient
 from .models import VALID_CATEGORIES, Summary
+from .summary_cache import SummaryCache
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,16 @@ logger = logging.getLogger(__name__)
 # exhaustion, which isn't worth waiting through.
 _RETRY_DELAY_CAP_SECONDS = 65.0
 
+# Cap for transient-error exponential backoff (distinct from the quota
+# path above, which follows the API's own retryDelay hint).
+_BACKOFF_CAP_SECONDS = 30.0
+_BACKOFF_JITTER_SECONDS = 0.5
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff delay for transient errors."""
+    return min(_BACKOFF_CAP_SECONDS, 2.0**attempt) + random.uniform(0, _BACKOFF_JITTER_SECONDS)
+
 
 def _parse_retry_delay_seconds(raw: str | int | float | None) -> float | None:
     """Parse a retryDelay value from a Gemini API error.
@@ -94,6 +107,14 @@ class AsyncGeminiClient:
     """
 
     def __init__(self, settings: Settings) -> None:
+        # Imported lazily (same pattern as db.get_db's firebase import):
+        # google.genai drags in a heavy dependency tree that shouldn't be
+        # paid at module import by tests, tooling, or runs that fail fast
+        # on configuration.
+        from google import genai as _genai
+        from google.genai import errors as genai_errors
+
+        self._errors = genai_errors
         self._client = _genai.Client(api_key=settings.google_api_key)
         self._model = settings.gemini_model
         self._retries = settings.gemini_retries
@@ -101,6 +122,11 @@ class AsyncGeminiClient:
         self._quota_exhausted_at: float | None = None
         self._last_call_at: float | None = None
 
+    @property
+    def model_name(self) -> str:
+        """Model identifier, exposed so cache keys can include it."""
+        return self._model
+
     @property
     def quota_exhausted(self) -> bool:
         """True when the per-minute or daily quota is currently latched.
@@ -167,7 +193,7 @@ class AsyncGeminiClient:
                     return text.strip()
                 logger.warning("Gemini returned no text (attempt %d)", attempt)
                 return None
-            except _genai_errors.APIError as exc:
+            except self._errors.APIError as exc:
                 code = getattr(exc, "code", None)
                 status = getattr(exc, "status", "")
                 is_quota = (
@@ -214,8 +240,20 @@ class AsyncGeminiClient:
                         f"{api_delay:.1f}" if api_delay is not None else "n/a",
                     )
                     return None
-                # Non-quota error: exponential backoff, no latch.
-                wait = 2 * attempt
+                # Non-quota 4xx (bad request, auth, not found) can't succeed
+                # on retry; fail fast instead of burning the retry budget.
+                if isinstance(code, int) and 400 <= code < 500:
+                    logger.error(
+                        "Gemini non-retryable client error (code=%s, status=%s): %s",
+                        code,
+                        status,
+                        str(exc)[:160],
+                    )
+                    return None
+                # Transient (5xx/unknown) error: jittered exponential
+                # backoff, no latch. Jitter keeps concurrent callers from
+                # retrying in lockstep against a recovering endpoint.
+                wait = _backoff_delay(attempt)
                 logger.warning(
                     "Gemini API error (attempt %d/%d, code=%s, status=%s): %s "
                     "-- sleeping %.1fs before retry",
@@ -231,7 +269,7 @@ class AsyncGeminiClient:
             except Exception:
                 logger.exception("Unexpected Gemini error (attempt %d)", attempt)
                 if attempt < self._retries:
-                    await asyncio.sleep(2 * attempt)
+                    await asyncio.sleep(_backoff_delay(attempt))
         return None
 
     async def generate_many(self, prompts: list[str], concurrency: int) -> list[str | None]:
@@ -245,29 +283,48 @@ class AsyncGeminiClient:
         return await asyncio.gather(*(_one(p) for p in prompts))
 
 
+# Compiled once at import; re.match(pattern_str, ...) pays a cache lookup
+# plus argument handling per line, and this runs for every line of every
+# article in a run.
+_TIMESTAMP_LINE_RE = re.compile(r"^\d{1,2}:\d{2}(\s*(GMT|BST))?$")
+
+
 def clean_article_text(text: str) -> str:
     """Remove junk, timestamps, boilerplate, duplicates."""
-    lines = text.split("\n")
     cleaned: list[str] = []
 
-    for line in lines:
+    for line in text.split("\n"):
         ln = line.strip()
         if not ln:
             continue
-        if re.match(r"^\d{1,2}:\d{2}(\s*(GMT|BST))?$", ln):
+        if _TIMESTAMP_LINE_RE.match(ln):
             continue
         if "Follow BBC" in ln or "Related Topics" in ln:
             continue
         cleaned.append(ln)
 
-    final = list(dict.fromkeys(cleaned))
-    return "\n".join(final)
+    return "\n".join(dict.fromkeys(cleaned))
+
+
+_WORD_RE = re.compile(r"\S+")
 
 
 def chunk_text(text: str, max_words: int) -> list[str]:
-    """Split text into safe word-bounded chunks for the LLM."""
-    words = text.split()
-    return [" ".join(words[i : i + max_words]) for i in range(0, len(words), max_words)]
+    """Split text into safe word-bounded chunks for the LLM.
+
+    Chunks are slices of the original string taken at word boundaries, so
+    splitting costs one regex scan plus one slice per chunk instead of
+    materializing a list of every word and re-joining each chunk. A side
+    effect is that original whitespace (e.g. line breaks between cleaned
+    lines) survives inside a chunk, which reads better in prompts anyway.
+    """
+    spans = [m.span() for m in _WORD_RE.finditer(text)]
+    if not spans:
+        return []
+    return [
+        text[spans[i][0] : spans[min(i + max_words, len(spans)) - 1][1]]
+        for i in range(0, len(spans), max_words)
+    ]
 
 
 def _language_prefix(language: str) -> str:
@@ -281,6 +338,11 @@ def _language_prefix(language: str) -> str:
     return ""
 
 
+# Prompt builders keep every stable instruction ahead of the dynamic
+# payload, with nothing after it. Provider-side prompt caching (Gemini
+# implicit caching, OpenAI-style prefix caching) keys on an exact shared
+# prefix, so instructions trailing the article text would make every
+# call a full-price cache miss.
 def _build_chunk_prompt(idx: int, chunk: str, language: str = "en") -> str:
     prefix = _language_prefix(language)
     return f"""
@@ -302,14 +364,13 @@ def _build_final_prompt(title: str, combined: str, language: str = "en") -> str:
 You are given several partial summaries of a BBC News article.
 Using them, write a single coherent summary of the entire article
 in about 120-180 words, in a neutral, factual, newsroom tone.
+Return only the final summary text, with no headings or bullet points.
 
 TITLE:
 {title}
 
 PARTIAL SUMMARIES:
 {combined}
-
-Return only the final summary text, with no headings or bullet points.
 """
 
 
@@ -334,11 +395,10 @@ def _build_category_prompt(title: str, summary_text: str) -> str:
     return f"""
 Classify this BBC News article into one of:
 politics, world, business, tech, science, health, uk, europe, other.
+Return ONLY the single category word.
 
 Title: {title}
 Summary: {summary_text}
-
-Return ONLY the single category word.
 """
 
 
@@ -603,18 +663,54 @@ async def summarize_article(
 ) -> Summary:
     """Summarize an article using chunk-merge strategy with a fallback path.
 
-    For short articles (one chunk or none) we skip the chunk-merge step
-    entirely and use the fallback prompt in a single API call. For longer
-    articles we chunk, summarize each chunk concurrently, then merge.
+    Articles up to ``summary_single_call_max_words`` cleaned words skip
+    the chunk-merge step entirely and use the fallback prompt in a single
+    API call. Only genuinely long articles are chunked, summarized
+    concurrently, then merged.
 
     Category classification is deterministic (URL patterns + source
     section + title keyword matching) so the pipeline does not spend an
     API call on a cosmetic label.
+
+    When ``summary_cache_dir`` is configured, the cleaned article text is
+    hashed together with the title and the client's model name and looked
+    up in the on-disk cache before any LLM call; hits skip the API
+    entirely. The category is still re-derived on every call so cached
+    entries follow classifier rule updates.
     """
     cleaned = clean_article_text(article_text or "")
+
+    # Cap the input before it reaches the prompt builders: the summary only
+    # needs the lead and body, and input tokens dominate per-article cost.
+    max_input = settings.summary_max_input_words
+    if max_input > 0:
+        words = cleaned.split()
+        if len(words) > max_input:
+            logger.info(
+                "Truncating article input from %d to %d words: %s",
+                len(words),
+                max_input,
+                title,
+            )
+            cleaned = " ".join(words[:max_input])
+
     if len(cleaned.split()) < settings.summary_min_words:
         cleaned += "\n(Note: Article text is short; summary may be limited.)"
 
+    cache = SummaryCache(settings.summary_cache_dir, ttl_days=settings.summary_cache_ttl_days)
+    model = getattr(client, "model_name", "")
+    cache_key = SummaryCache.key(cleaned, language, model=model, title=title)
+    # Second-tier fuzzy key: catches mid-day rewrites (headline edits,
+    # appended paragraphs) that bust the exact hash.
+    fingerprint_key = SummaryCache.fingerprint(cleaned, language, model=model)
+    cached_text = cache.get(cache_key) or cache.get(fingerprint_key)
+    if cached_text is not None:
+        return Summary(
+            title=title,
+            summary=cached_text,
+            category=classify_article(title=title, url=url, section=section),
+        )
+
     chunks = chunk_text(cleaned, settings.chunk_max_words)
 
     if not chunks:
@@ -628,9 +724,11 @@ async def summarize_article(
             category=classify_article(title=title, url=url, section=section),
         )
 
-    if len(chunks) <= 1:
-        # Short article: one call, no merge step. Saves an API call
-        # compared to the previous "chunk then merge" path.
+    single_call_cap = settings.summary_single_call_max_words
+    if len(chunks) <= 1 or (single_call_cap > 0 and len(cleaned.split()) <= single_call_cap):
+        # Short-to-medium article: one call, no chunk+merge round-trips.
+        # The model's context comfortably fits anything under the cap, so
+        # splitting such articles only multiplied latency and quota use.
         fallback = await client.generate(_build_fallback_prompt(title, cleaned, language))
         summary_text = fallback or "Summary generation failed."
     else:
@@ -648,6 +746,10 @@ async def summarize_article(
             final = await client.generate(_build_final_prompt(title, combined, language))
             summary_text = final or "Summary generation failed."
 
+    if summary_text != "Summary generation failed.":
+        cache.put(cache_key, summary_text)
+        cache.put(fingerprint_key, summary_text)
+
     category = classify_article(title=title, url=url, section=section)
 
     return Summary(title=title, summary=summary_text, category=category)
@@ -0,0 +1,114 @@
+"""On-disk cache for generated summaries, keyed by article content hash.
+
+Summarization is by far the most expensive step in the pipeline (seconds of
+LLM latency plus quota), and the same article body is frequently submitted
+more than once: re-runs after a partial failure, ``--retry-failed`` passes,
+and local development iteration. Hashing the cleaned article text and
+storing the generated summary on disk turns each repeat into a file read.
+
+The cache is disabled by default (``summary_cache_dir`` empty), matching
+the convention used for optional features elsewhere in Settings. Only the
+generated summary text is cached — the category is always re-derived by
+the deterministic classifier so cached entries pick up new rules for free.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from pathlib import Path
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_SECONDS_PER_DAY = 86400.0
+
+# How many leading words of the cleaned body the fuzzy fingerprint hashes.
+_FINGERPRINT_WORDS = 60
+
+
+class SummaryCache:
+    """File-per-entry summary cache under a configurable directory.
+
+    Construct with an empty ``cache_dir`` to get a disabled cache whose
+    ``get``/``put`` are no-ops; call sites don't need to branch.
+
+    Entries expire ``ttl_days`` after they were written (checked lazily on
+    ``get``; stale files are unlinked). News copy gets edited after
+    publication, so an unbounded cache would keep serving a summary of a
+    superseded revision forever. ``ttl_days=0`` disables expiry.
+    """
+
+    def __init__(self, cache_dir: str, ttl_days: int = 7) -> None:
+        self._dir = Path(cache_dir) if cache_dir else None
+        self._ttl_seconds = ttl_days * _SECONDS_PER_DAY
+
+    @property
+    def enabled(self) -> bool:
+        return self._dir is not None
+
+    @staticmethod
+    def key(text: str, language: str = "en", model: str = "", title: str = "") -> str:
+        """Deterministic cache key for a cleaned article body.
+
+        The language is part of the key so an English and a Portuguese
+        summary of the same text never collide; the model name keeps
+        entries from one provider/model from being served after a model
+        switch, and the title guards against distinct articles that share
+        boilerplate-heavy bodies.
+        """
+        return hashlib.sha256(f"{model}|{language}|{title}|{text}".encode()).hexdigest()
+
+    @staticmethod
+    def fingerprint(text: str, language: str = "en", model: str = "") -> str:
+        """Fuzzy second-tier key hashing only the normalized lead of the body.
+
+        Mid-day rewrites usually tweak the headline or append paragraphs
+        while leaving the opening paragraphs intact, so the exact key
+        misses even though the article is effectively the same. Hashing
+        the first ``_FINGERPRINT_WORDS`` lowercased, whitespace-collapsed
+        words (no title) absorbs those near-duplicates. Distinct articles
+        sharing an identical 60-word lead are vanishingly rare in news
+        copy, so collisions are acceptable for a cache.
+        """
+        lead = " ".join(text.lower().split()[:_FINGERPRINT_WORDS])
+        return hashlib.sha256(f"fp|{model}|{language}|{lead}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        assert self._dir is not None
+        return self._dir / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached summary text for ``key``, or None on a miss."""
+        if self._dir is None:
+            return None
+        path = self._path(key)
+        try:
+            if self._ttl_seconds > 0 and (time.time() - path.stat().st_mtime) > self._ttl_seconds:
+                logger.info("Summary cache entry expired (%s)", key[:12])
+                path.unlink(missing_ok=True)
+                return None
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Unreadable summary cache entry %s; ignoring", path)
+            return None
+        summary = data.get("summary")
+        if isinstance(summary, str) and summary:
+            logger.info("Summary cache hit (%s)", key[:12])
+            return summary
+        return None
+
+    def put(self, key: str, summary: str) -> None:
+        """Store a generated summary. Failures are logged, never raised."""
+        if self._dir is None or not summary:
+            return
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            # orjson emits UTF-8 bytes directly; no separate encode step.
+            self._path(key).write_bytes(orjson.dumps({"summary": summary}))
+        except OSError:
+            logger.warning("Failed to write summary cache entry %s", key[:12])
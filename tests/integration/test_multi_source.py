@@ -89,6 +89,21 @@ class MockCollection:
         return self
 
 
+class MockWriteBatch:
+    """Queues (ref, data) set ops and applies them on commit()."""
+
+    def __init__(self) -> None:
+        self._ops: list[tuple[object, dict]] = []
+
+    def set(self, ref, data: dict) -> None:
+        self._ops.append((ref, data))
+
+    def commit(self) -> None:
+        for ref, data in self._ops:
+            ref.set(data)
+        self._ops.clear()
+
+
 class MockFirestoreClient:
     def __init__(self, subscribers: list[str] | None = None) -> None:
         self._collections: dict[str, MockCollection] = {}
@@ -99,6 +114,9 @@ class MockFirestoreClient:
             self._collections[name] = MockCollection(name, subscribers=self._subs)
         return self._collections[name]
 
+    def batch(self) -> MockWriteBatch:
+        return MockWriteBatch()
+
 
 class FakeSMTP:
     def __init__(self, *a, **kw):
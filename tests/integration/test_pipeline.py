@@ -109,6 +109,21 @@ class MockCollection:
         return self
 
 
+class MockWriteBatch:
+    """Queues (ref, data) set ops and applies them on commit()."""
+
+    def __init__(self) -> None:
+        self._ops: list[tuple[object, dict]] = []
+
+    def set(self, ref, data: dict) -> None:
+        self._ops.append((ref, data))
+
+    def commit(self) -> None:
+        for ref, data in self._ops:
+            ref.set(data)
+        self._ops.clear()
+
+
 class MockFirestoreClient:
     """In-memory Firestore client supporting only the collections we use."""
 
@@ -132,6 +147,9 @@ class MockFirestoreClient:
                 self._collections[name] = MockCollection(name, subscribers=self._subs)
         return self._collections[name]
 
+    def batch(self) -> MockWriteBatch:
+        return MockWriteBatch()
+
 
 def _patch_http(article_html: str, bbc_homepage_html: str) -> None:
     """Patch the scraper to return canned HTML responses.
@@ -415,8 +433,10 @@ async def test_to_flag_skips_when_recipient_not_in_group(
 async def test_pipeline_short_circuits_when_circuit_breaker_opens(
     test_settings: Settings,
     bbc_homepage_html: str,
+    monkeypatch,
 ):
     """If all scrapes fail, the circuit breaker should open and the dispatcher should not run."""
+    monkeypatch.setattr("daily_bot.scraper._FETCH_BACKOFF_SECONDS", 0)
     test_settings.circuit_breaker_threshold = 2
     test_settings.summarize_concurrency = 1
     test_settings.scrape_concurrency = 1
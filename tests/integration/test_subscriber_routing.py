@@ -95,6 +95,21 @@ class MockCollection:
         return self
 
 
+class MockWriteBatch:
+    """Queues (ref, data) set ops and applies them on commit()."""
+
+    def __init__(self) -> None:
+        self._ops: list[tuple[object, dict]] = []
+
+    def set(self, ref, data: dict) -> None:
+        self._ops.append((ref, data))
+
+    def commit(self) -> None:
+        for ref, data in self._ops:
+            ref.set(data)
+        self._ops.clear()
+
+
 class MockFirestoreClient:
     def __init__(self, subscriber_docs: list[dict] | None = None) -> None:
         self._collections: dict[str, MockCollection] = {}
@@ -110,6 +125,9 @@ class MockFirestoreClient:
                 self._collections[name] = MockCollection(name)
         return self._collections[name]
 
+    def batch(self) -> MockWriteBatch:
+        return MockWriteBatch()
+
 
 class _RecordingSMTP:
     """Captures every (recipient, html_body) pair on the class."""
@@ -128,7 +146,11 @@ class _RecordingSMTP:
     def login(self, *args, **kwargs):
         pass
 
-    def sendmail(self, sender: str, recipient: str, message: str) -> None:
+    def sendmail(self, sender: str, recipient: str, message: str | bytes) -> None:
+        # The emailer hands sendmail the wire-ready bytes form; decode so
+        # the assertions below can keep matching on plain strings.
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", errors="replace")
         type(self).sends.append((recipient, message))
 
 
@@ -12,6 +12,7 @@ from daily_bot.emailer import (
     THEME,
     _branded_placeholder,
     _build_message,
+    _send_batch,
     render_email_html,
     send_daily_digest_async,
     send_to_subscriber,
@@ -261,7 +262,8 @@ def test_send_to_subscriber_calls_login_and_sendmail(mock_smtp, test_settings):
     args = mock_server.sendmail.call_args[0]
     assert args[0] == "bot@example.com"
     assert args[1] == "user@example.com"
-    assert "Subject:" in args[2]
+    # The message is serialized to bytes once, not via as_string()
+    assert b"Subject:" in args[2]
 
 
 @patch("daily_bot.emailer.smtplib.SMTP_SSL")
@@ -273,6 +275,29 @@ def test_send_to_subscriber_reraises_auth_error(mock_smtp, test_settings):
         send_to_subscriber(test_settings, "user@example.com", "<html></html>")
 
 
+@patch("daily_bot.emailer.smtplib.SMTP_SSL")
+def test_send_batch_logs_in_once_for_many_recipients(mock_smtp, test_settings):
+    """A batch shares one SMTP connection: one login, one sendmail per recipient."""
+    mock_server = MagicMock()
+    mock_smtp.return_value.__enter__.return_value = mock_server
+
+    results = _send_batch(test_settings, ["a@x.com", "b@x.com", "c@x.com"], "<html></html>")
+
+    assert mock_smtp.call_count == 1
+    mock_server.login.assert_called_once_with("bot@example.com", "password1234")
+    assert mock_server.sendmail.call_count == 3
+    assert results == [("a@x.com", True, None), ("b@x.com", True, None), ("c@x.com", True, None)]
+
+
+@patch("daily_bot.emailer.smtplib.SMTP_SSL")
+def test_send_batch_marks_all_failed_on_auth_error(mock_smtp, test_settings):
+    mock_smtp.return_value.__enter__.return_value.login.side_effect = (
+        smtplib.SMTPAuthenticationError(535, b"auth failed")
+    )
+    results = _send_batch(test_settings, ["a@x.com", "b@x.com"], "<html></html>")
+    assert [(email, ok) for email, ok, _ in results] == [("a@x.com", False), ("b@x.com", False)]
+
+
 # ---------------- Async dispatch ----------------
 
 
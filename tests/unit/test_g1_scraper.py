@@ -182,6 +182,19 @@ async def test_g1_fetch_urls_extracts_ghtml_links():
     assert all(u.startswith("https://g1.globo.com/") for u in urls)
 
 
+async def test_g1_fetch_urls_bs4_fallback_matches_selectolax(monkeypatch):
+    """Without selectolax, the bs4 fallback must return the same URLs."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=g1_homepage_html().encode())
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        fast = await G1Source().fetch_urls(client, limit=10)
+        monkeypatch.setattr("daily_bot.sources.g1.LexborHTMLParser", None)
+        fallback = await G1Source().fetch_urls(client, limit=10)
+
+    assert fallback == fast
+
+
 async def test_g1_fetch_urls_deduplicates():
     """Duplicate URLs (same href) should appear only once."""
     transport = httpx.MockTransport(
@@ -216,8 +229,9 @@ async def test_g1_fetch_urls_returns_absolute_urls_for_relative_hrefs():
     assert "https://g1.globo.com/tecnologia/noticia/2026/01/01/tech-1.ghtml" in urls
 
 
-async def test_g1_fetch_urls_handles_http_error():
+async def test_g1_fetch_urls_handles_http_error(monkeypatch):
     """A 5xx response should result in an empty list, not an exception."""
+    monkeypatch.setattr("daily_bot.scraper._FETCH_BACKOFF_SECONDS", 0)
     transport = httpx.MockTransport(lambda request: httpx.Response(500))
     async with httpx.AsyncClient(transport=transport) as client:
         urls = await G1Source().fetch_urls(client, limit=5)
@@ -304,8 +318,9 @@ async def test_g1_scrape_article_falls_back_to_article_img():
     assert article.image_url == "https://s2.glbimg.com/fallback/first.jpg"
 
 
-async def test_g1_scrape_article_handles_network_error():
+async def test_g1_scrape_article_handles_network_error(monkeypatch):
     """A 5xx response should return None instead of raising."""
+    monkeypatch.setattr("daily_bot.scraper._FETCH_BACKOFF_SECONDS", 0)
     transport = httpx.MockTransport(lambda request: httpx.Response(500))
     async with httpx.AsyncClient(transport=transport) as client:
         article = await G1Source().scrape_article(
@@ -0,0 +1,44 @@
+"""Unit tests for the per-host scrape rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from daily_bot.rate_limiter import HostRateLimiter
+
+
+async def test_zero_interval_never_sleeps():
+    """The default (interval 0) must be a no-op, however often it's called."""
+    rl = HostRateLimiter(0.0)
+    start = time.monotonic()
+    for _ in range(50):
+        await rl.wait("https://www.bbc.com/news/articles/x")
+    assert time.monotonic() - start < 0.05
+
+
+async def test_spaces_requests_to_same_host():
+    """Back-to-back calls for one host should be at least an interval apart."""
+    rl = HostRateLimiter(0.05)
+    start = time.monotonic()
+    await rl.wait("https://www.bbc.com/news/articles/1")
+    await rl.wait("https://www.bbc.com/news/articles/2")
+    await rl.wait("https://www.bbc.com/news/articles/3")
+    assert time.monotonic() - start >= 0.1
+
+
+async def test_hosts_are_independent():
+    """Spacing on one host must not delay requests to another."""
+    rl = HostRateLimiter(0.5)
+    await rl.wait("https://www.bbc.com/news/articles/1")
+    start = time.monotonic()
+    await rl.wait("https://g1.globo.com/noticia/1")
+    assert time.monotonic() - start < 0.1
+
+
+async def test_concurrent_waiters_do_not_stampede():
+    """N concurrent waiters should spread out over (N-1) intervals."""
+    rl = HostRateLimiter(0.05)
+    start = time.monotonic()
+    await asyncio.gather(*(rl.wait("https://www.bbc.com/news/articles/x") for _ in range(4)))
+    assert time.monotonic() - start >= 0.15
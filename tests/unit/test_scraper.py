@@ -131,7 +131,23 @@ async def test_get_top_story_urls_respects_limit(bbc_homepage_html: str):
     assert len(urls) == 2
 
 
-async def test_get_top_story_urls_handles_http_error():
+async def test_get_top_story_urls_bs4_fallback_matches_selectolax(
+    bbc_homepage_html: str, monkeypatch
+):
+    """Without selectolax, the strained-bs4 fallback must return the same URLs."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=bbc_homepage_html.encode())
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        fast = await get_top_story_urls_async(client, "https://www.bbc.com/news", limit=10)
+        monkeypatch.setattr("daily_bot.scraper.LexborHTMLParser", None)
+        fallback = await get_top_story_urls_async(client, "https://www.bbc.com/news", limit=10)
+    assert fallback == fast
+
+
+async def test_get_top_story_urls_handles_http_error(monkeypatch):
+    monkeypatch.setattr("daily_bot.scraper._FETCH_BACKOFF_SECONDS", 0)
+
     def handler(request: httpx.Request) -> httpx.Response:
         return httpx.Response(500)
 
@@ -164,6 +180,45 @@ async def test_scrape_article_content_returns_none_on_404():
     assert article is None
 
 
+async def test_scrape_retries_transient_500_then_succeeds(article_html: str, monkeypatch):
+    """A 5xx blip on the first attempt should be retried, not dropped."""
+    monkeypatch.setattr("daily_bot.scraper._FETCH_BACKOFF_SECONDS", 0)
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, content=article_html.encode())
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        article = await scrape_article_content_async(
+            client, "https://www.bbc.com/news/articles/abc"
+        )
+    assert article is not None
+    assert attempts == 2
+
+
+async def test_scrape_does_not_retry_4xx():
+    """Re-requesting a 404 can't help; exactly one attempt should be made."""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        article = await scrape_article_content_async(
+            client, "https://www.bbc.com/news/articles/gone"
+        )
+    assert article is None
+    assert attempts == 1
+
+
 async def test_scrape_many_runs_concurrently_and_skips_failures(test_settings, article_html: str):
     """scrape_many should gather all URLs and drop None results."""
 
@@ -118,6 +118,21 @@ def test_category_prompt_includes_categories():
         assert cat in prompt
 
 
+def test_prompts_put_instructions_before_dynamic_payload():
+    """All stable instructions must precede the article text.
+
+    Provider-side prompt caching keys on an exact shared prefix, so an
+    instruction trailing the dynamic payload would defeat it.
+    """
+    final = _build_final_prompt("The Title", "Partial A")
+    assert final.index("Return only") < final.index("TITLE:")
+    assert final.rstrip().endswith("Partial A")
+
+    category = _build_category_prompt("The Title", "The summary")
+    assert category.index("Return ONLY") < category.index("Title:")
+    assert category.rstrip().endswith("The summary")
+
+
 # ---------------- end-to-end summarize (with FakeGeminiClient) ----------------
 
 
@@ -194,6 +209,30 @@ async def test_summarize_short_article_uses_single_call(test_settings: Settings)
     assert len(fake.calls) == 1
 
 
+async def test_summarize_medium_article_under_cap_uses_single_call(test_settings: Settings):
+    """A multi-chunk article within summary_single_call_max_words gets one call."""
+    from tests.conftest import FakeGeminiClient
+
+    fake = FakeGeminiClient(responses=["One-shot summary."])
+    # 1000 words = 2 chunks at max_words=600, but under the 1200-word cap.
+    summary = await summarize_article(fake, "word " * 1000, "Title", test_settings)
+    assert summary.summary == "One-shot summary."
+    assert len(fake.calls) == 1
+    assert "ARTICLE:" in fake.calls[0]
+
+
+async def test_summarize_single_call_cap_zero_restores_chunk_merge(test_settings: Settings):
+    """With the cap disabled, a 2-chunk article goes through chunk + merge."""
+    from tests.conftest import FakeGeminiClient
+
+    test_settings.summary_single_call_max_words = 0
+    fake = FakeGeminiClient(responses=["Partial one.", "Partial two.", "Merged."])
+    summary = await summarize_article(fake, "word " * 1000, "Title", test_settings)
+    assert summary.summary == "Merged."
+    # 2 chunk calls + 1 final merge.
+    assert len(fake.calls) == 3
+
+
 async def test_summarize_invalid_category_becomes_other(test_settings: Settings):
     """No URL + no keyword-matching title -> category defaults to 'other'."""
     from tests.conftest import FakeGeminiClient
@@ -866,6 +905,35 @@ async def test_summarize_empty_chunks_returns_failed_summary(test_settings: Sett
     assert fake.calls == []
 
 
+# ---------------- input-length cap ----------------
+
+
+async def test_summarize_truncates_input_beyond_cap(test_settings: Settings):
+    """Words past summary_max_input_words must never reach a prompt."""
+    from tests.conftest import FakeGeminiClient
+
+    test_settings.summary_max_input_words = 100
+    fake = FakeGeminiClient(responses=["Capped summary."])
+    article = "front " * 100 + "tailmarker " * 20
+    summary = await summarize_article(fake, article, "Title", test_settings)
+    assert summary.summary == "Capped summary."
+    # 100 words fit in a single chunk -> exactly one call, without the tail.
+    assert len(fake.calls) == 1
+    assert "tailmarker" not in fake.calls[0]
+
+
+async def test_summarize_cap_zero_disables_truncation(test_settings: Settings):
+    """summary_max_input_words=0 must preserve the full article text."""
+    from tests.conftest import FakeGeminiClient
+
+    test_settings.summary_max_input_words = 0
+    fake = FakeGeminiClient(responses=["S1", "S2", "S3", "Final."])
+    summary = await summarize_article(fake, "word " * 1500, "Title", test_settings)
+    assert summary.summary == "Final."
+    # 1500 words at chunk_max_words=600 still produce 3 chunks + merge.
+    assert len(fake.calls) == 4
+
+
 # ---------------- quota-exhausted latch ----------------
 
 
@@ -1002,6 +1070,30 @@ async def test_non_quota_error_does_not_latch():
     assert client.quota_exhausted is False
 
 
+async def test_non_retryable_4xx_fails_fast():
+    """A 400 INVALID_ARGUMENT should fail immediately: no retries, no latch."""
+    from daily_bot.config import Settings
+    from daily_bot.summarizer import AsyncGeminiClient
+
+    settings = Settings(
+        google_api_key="test",
+        firebase_credentials="{}",
+        sender_email="a@b.com",
+        sender_password="x" * 16,
+        gemini_retries=6,
+    )
+    bad_request = _make_api_error(400, "INVALID_ARGUMENT")
+    stub = _StubClient(errors=[bad_request], responses=["unused"])
+    client = AsyncGeminiClient(settings)
+    client._client = stub  # type: ignore[assignment]
+
+    result = await client.generate("hello")
+    assert result is None
+    assert client.quota_exhausted is False
+    # Exactly 1 HTTP call: a bad request can't succeed on retry.
+    assert stub.calls == 1
+
+
 async def test_first_429_recovers_within_retry_budget():
     """Real exhaustion may eventually latch; verify the retry doesn't waste calls."""
     from daily_bot.config import Settings
@@ -0,0 +1,166 @@
+"""Unit tests for the on-disk summary cache."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from daily_bot.config import Settings
+from daily_bot.summarizer import summarize_article
+from daily_bot.summary_cache import SummaryCache
+
+# ---------------- SummaryCache ----------------
+
+
+def test_cache_disabled_when_dir_empty():
+    cache = SummaryCache("")
+    assert not cache.enabled
+    assert cache.get("deadbeef") is None
+    # put must be a silent no-op
+    cache.put("deadbeef", "some summary")
+    assert cache.get("deadbeef") is None
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = SummaryCache(str(tmp_path / "cache"))
+    key = SummaryCache.key("article body text")
+    assert cache.get(key) is None
+    cache.put(key, "A cached summary.")
+    assert cache.get(key) == "A cached summary."
+
+
+def test_cache_key_depends_on_language():
+    body = "same article body"
+    assert SummaryCache.key(body, "en") != SummaryCache.key(body, "pt-BR")
+
+
+def test_cache_key_depends_on_content():
+    assert SummaryCache.key("body one") != SummaryCache.key("body two")
+
+
+def test_fingerprint_ignores_trailing_edits_and_case():
+    lead = " ".join(f"word{i}" for i in range(60))
+    original = SummaryCache.fingerprint(f"{lead} original tail here")
+    appended = SummaryCache.fingerprint(f"{lead} a freshly appended closing paragraph")
+    assert original == appended
+    assert original == SummaryCache.fingerprint(f"{lead.upper()}  extra   spacing")
+
+
+def test_fingerprint_depends_on_lead_model_and_language():
+    body = "short article body"
+    base = SummaryCache.fingerprint(body)
+    assert base != SummaryCache.fingerprint("a different article body")
+    assert base != SummaryCache.fingerprint(body, model="llama-3.1-70b")
+    assert base != SummaryCache.fingerprint(body, "pt-BR")
+
+
+def test_cache_key_depends_on_model_and_title():
+    body = "same article body"
+    base = SummaryCache.key(body, model="gemini-2.5-flash", title="Title A")
+    assert base != SummaryCache.key(body, model="llama-3.1-70b", title="Title A")
+    assert base != SummaryCache.key(body, model="gemini-2.5-flash", title="Title B")
+
+
+def test_cache_expires_stale_entries(tmp_path):
+    cache = SummaryCache(str(tmp_path), ttl_days=7)
+    key = SummaryCache.key("text")
+    cache.put(key, "An old summary.")
+    # Age the entry past the TTL by rewinding its mtime eight days.
+    entry = tmp_path / f"{key}.json"
+    stale = time.time() - 8 * 86400
+    os.utime(entry, (stale, stale))
+    assert cache.get(key) is None
+    # The stale file is removed so a fresh put starts a new TTL window.
+    assert not entry.exists()
+
+
+def test_cache_ttl_zero_never_expires(tmp_path):
+    cache = SummaryCache(str(tmp_path), ttl_days=0)
+    key = SummaryCache.key("text")
+    cache.put(key, "An old summary.")
+    entry = tmp_path / f"{key}.json"
+    stale = time.time() - 365 * 86400
+    os.utime(entry, (stale, stale))
+    assert cache.get(key) == "An old summary."
+
+
+def test_cache_ignores_corrupt_entry(tmp_path):
+    cache = SummaryCache(str(tmp_path))
+    key = SummaryCache.key("text")
+    (tmp_path / f"{key}.json").write_text("{not json", encoding="utf-8")
+    assert cache.get(key) is None
+
+
+def test_cache_put_skips_empty_summary(tmp_path):
+    cache = SummaryCache(str(tmp_path))
+    key = SummaryCache.key("text")
+    cache.put(key, "")
+    assert cache.get(key) is None
+
+
+# ---------------- summarize_article integration ----------------
+
+
+async def test_summarize_hits_cache_on_second_call(test_settings: Settings, tmp_path):
+    """The second summarize call for the same content must not call the LLM."""
+    from tests.conftest import FakeGeminiClient
+
+    test_settings.summary_cache_dir = str(tmp_path)
+    fake = FakeGeminiClient(responses=["Generated summary.", "unused"])
+
+    first = await summarize_article(
+        fake,
+        "Short article text.",
+        "Title",
+        test_settings,
+        url="https://www.bbc.com/news/world/articles/abc",
+    )
+    assert first.summary == "Generated summary."
+    assert len(fake.calls) == 1
+
+    second = await summarize_article(
+        fake,
+        "Short article text.",
+        "Title",
+        test_settings,
+        url="https://www.bbc.com/news/world/articles/abc",
+    )
+    assert second.summary == "Generated summary."
+    # No additional LLM call; the scripted "unused" response stays unconsumed.
+    assert len(fake.calls) == 1
+    assert second.category == "world"
+
+
+async def test_summarize_fingerprint_absorbs_headline_edit(test_settings: Settings, tmp_path):
+    """A mid-day headline rewrite of the same body must still hit the cache."""
+    from tests.conftest import FakeGeminiClient
+
+    test_settings.summary_cache_dir = str(tmp_path)
+    fake = FakeGeminiClient(responses=["Generated summary.", "unused"])
+
+    body = "Short article text."
+    first = await summarize_article(fake, body, "Original headline", test_settings)
+    assert first.summary == "Generated summary."
+    assert len(fake.calls) == 1
+
+    # New title busts the exact key; the lead fingerprint still matches.
+    second = await summarize_article(fake, body, "Updated headline", test_settings)
+    assert second.summary == "Generated summary."
+    assert len(fake.calls) == 1
+
+
+async def test_summarize_does_not_cache_failures(test_settings: Settings, tmp_path):
+    """A failed generation must not poison the cache for later retries."""
+    from tests.conftest import FakeGeminiClient
+
+    test_settings.summary_cache_dir = str(tmp_path)
+
+    failing = FakeGeminiClient(responses=[None])
+    failed = await summarize_article(failing, "Some article text.", "T", test_settings)
+    assert "failed" in failed.summary.lower()
+
+    # A retry with a working client must reach the LLM, not the cache.
+    working = FakeGeminiClient(responses=["Recovered summary."])
+    retried = await summarize_article(working, "Some article text.", "T", test_settings)
+    assert retried.summary == "Recovered summary."
+    assert len(working.calls) == 1